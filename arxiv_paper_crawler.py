@@ -6,17 +6,90 @@ ArXiv论文爬虫 - VLM/VLA相关论文自动抓取和总结
 """
 
 import arxiv
-import requests
+import aiohttp
+import ahocorasick
+import aiofiles
+import asyncio
+import hashlib
+import heapq
 import json
+import logging
+import orjson
 import os
-from datetime import datetime, timedelta
-from typing import List, Dict, Any
+import re
 import time
+from collections import Counter
+from dataclasses import dataclass
+from datetime import datetime, timedelta, timezone
+from operator import attrgetter, itemgetter
+from typing import List, Dict, Any, Optional, Tuple
+from config import Config
 from setup_logging import get_logger
+from tenacity import (
+    AsyncRetrying,
+    before_sleep_log,
+    retry_if_exception_type,
+    stop_after_attempt,
+    wait_exponential_jitter,
+)
 
 # 获取日志器
 logger = get_logger('arxiv_crawler')
 
+# 各搜索主题的相关性关键词：(高权重, 中权重, 低权重)
+RELEVANCE_KEYWORDS = {
+    'VLM': (
+        ["vlm", "vision language model", "multimodal", "vision-language"],
+        ["visual reasoning", "visual instruction", "image captioning", "visual grounding"],
+        ["cross-modal", "image-text", "visual understanding"],
+    ),
+    'VLA': (
+        ["vla", "vision language action", "embodied ai", "embodied agent"],
+        ["robotic manipulation", "action planning", "visual navigation", "robot learning"],
+        ["policy learning", "motor control", "behavioral cloning"],
+    ),
+    'BOTH': (
+        ["vlm", "vla", "vision language model", "vision language action", "embodied ai"],
+        ["multimodal", "vision-language", "visual reasoning", "robotic manipulation"],
+        ["visual instruction", "image captioning", "action planning", "cross-modal"],
+    ),
+}
+RELEVANCE_WEIGHTS = (0.3, 0.2, 0.1)
+
+# 解析失败时填充的占位总结，出现即视为可疑，且不写入缓存
+SUMMARY_FAILURE_MARKERS = ("解析失败", "Parsing failed")
+
+# 一次扫描解析Kimi返回的中英文总结，英文部分可缺省；
+# 中文标题可位于任一行首（允许前置空白、Markdown的*和#以及开场白），标题前的内容丢弃
+SUMMARY_RE = re.compile(
+    r'(?:.*?^[ \t>*#]*【?中文总结】?[*#:：]*)?'
+    r'\s*(?P<zh>.*?)[\s*#]*'
+    r'(?:(?:【English Summary】|English Summary)[*#:：]*\s*(?P<en>.*))?\Z',
+    re.DOTALL | re.MULTILINE
+)
+
+# 计算总结与摘要相似度时使用的英文词
+WORD_RE = re.compile(r'[a-z]{3,}')
+
+# 计算相似度时忽略的英文虚词和论文总结中的套话，它们在任何总结和摘要中都会出现
+SIMILARITY_STOPWORDS = frozenset("""
+about above across after again against all almost also although among and another any are around based
+because been before being below between both but can could does doing done during each either else even
+ever every few for from further had has have having here how however into its itself just least less
+many more most much must near neither nor not now off often once one only onto other others otherwise
+our ours out over own per rather same several should since some such than that the their theirs them
+themselves then there therefore these they this those though through thus too toward towards under
+until upon very via was were what when where whether which while who whom whose why will with within
+without would yet you your
+paper work study authors propose proposed proposes present presents introduce introduces new novel
+method methods approach approaches problem problems address addresses addressing tackle tackles solve
+solves achieve achieves achieving show shows demonstrate demonstrates result results key main core
+contribution contributions existing use using used first significantly different
+""".split())
+
+# 总结提示词版本，修改提示词后需递增以使缓存失效
+PROMPT_VERSION = "v1"
+
 class KimiAPIError(Exception):
     """Kimi API调用失败的自定义异常"""
     def __init__(self, paper_title: str, paper_id: str, error_code: int = None, error_message: str = None, pdf_url: str = None):
@@ -37,6 +110,9 @@ class KimiAPIError(Exception):
 
         super().__init__(msg)
 
+class KimiTransientError(KimiAPIError):
+    """Kimi API临时错误（频率超限、服务器错误、超时、网络错误），可退避重试"""
+
 class PaperProcessingError(Exception):
     """论文处理失败的自定义异常"""
     def __init__(self, paper_title: str, paper_id: str, original_error: Exception):
@@ -47,6 +123,23 @@ class PaperProcessingError(Exception):
         msg = f"论文处理失败 - 标题: '{paper_title}' (ID: {paper_id}), 原因: {str(original_error)}"
         super().__init__(msg)
 
+@dataclass(slots=True)
+class PaperRecord:
+    """处理完成的论文记录，字段顺序即输出JSON的字段顺序"""
+    id: str
+    title: str
+    authors: List[str]
+    published_date: str
+    updated_date: Optional[str]
+    categories: List[str]
+    primary_category: str
+    pdf_url: str
+    arxiv_url: str
+    summary: Dict[str, str]
+    crawl_timestamp: str
+    relevance_score: float
+    processing_status: str = "success"
+
 class ArxivPaperCrawler:
     def __init__(self, kimi_api_key: str, kimi_base_url: str = "https://api.moonshot.cn/v1"):
         """
@@ -58,74 +151,294 @@ class ArxivPaperCrawler:
         """
         self.kimi_api_key = kimi_api_key
         self.kimi_base_url = kimi_base_url
+        # 不固定Content-Type：json请求由aiohttp自动设置，批处理任务的文件上传需要multipart
         self.headers = {
-            "Authorization": f"Bearer {kimi_api_key}",
-            "Content-Type": "application/json"
+            "Authorization": f"Bearer {kimi_api_key}"
         }
 
         # 从配置获取搜索关键词和延迟设置
-        from config import Config
-        self.keywords = Config.get_search_keywords()
-        self.search_topic = Config.SEARCH_TOPIC
-        self.kimi_request_delay = Config.KIMI_REQUEST_DELAY
-        self.paper_processing_delay = Config.PAPER_PROCESSING_DELAY
-        self.min_relevance_score = Config.MIN_RELEVANCE_SCORE
-        self.enable_verification = Config.ENABLE_VERIFICATION
-        self.verification_delay = Config.VERIFICATION_DELAY
-        self.max_verification_attempts = Config.MAX_VERIFICATION_ATTEMPTS
-
-    def search_papers(self, days_back: int = 1) -> List[arxiv.Result]:
+        self.cfg = Config.load()
+
+        # 预先展开相关性关键词权重表并构建自动机，一次扫描即可匹配全部关键词
+        self._kw_weights = self._build_keyword_weights()
+        self._relevance_automaton = self._build_relevance_automaton()
+
+        # 每次 process_papers 开始时设置的抓取时间戳
+        self._crawl_ts: Optional[str] = None
+
+        # arxiv客户端复用连接；整个时间窗口一个查询，每页最多2000条（arxiv API上限），通常单页即可
+        self._arxiv_client = arxiv.Client(page_size=min(2000, self.cfg.max_results))
+
+        # 异步HTTP会话及信号量、锁在 __aenter__ 中创建，绑定到当前事件循环
+        self._session: Optional[aiohttp.ClientSession] = None
+        self._semaphore: Optional[asyncio.Semaphore] = None  # 并发处理的批次数
+        self._request_semaphore: Optional[asyncio.Semaphore] = None  # 同时在途的Kimi请求数
+
+        # 限速器：记录下一次允许发起Kimi请求的时间点，所有请求共享
+        self._rate_lock: Optional[asyncio.Lock] = None
+        self._next_allowed_ts = 0.0
+
+        # Kimi批处理任务返回的总结，summarize_batch 优先使用
+        self._prefetched_summaries: Dict[str, Dict[str, str]] = {}
+
+    async def __aenter__(self) -> "ArxivPaperCrawler":
+        # 复用同一个连接池，避免每次请求重新进行TCP+TLS握手；连接数与在途请求上限一致
+        connector = aiohttp.TCPConnector(limit=self.cfg.kimi_max_concurrency, keepalive_timeout=60)
+        self._session = aiohttp.ClientSession(connector=connector, headers=self.headers)
+        self._semaphore = asyncio.Semaphore(self.cfg.max_workers)
+        self._request_semaphore = asyncio.Semaphore(self.cfg.kimi_max_concurrency)
+        self._rate_lock = asyncio.Lock()
+        return self
+
+    async def __aexit__(self, exc_type, exc, tb) -> None:
+        await self.close()
+
+    async def close(self) -> None:
+        """关闭HTTP会话，释放连接池"""
+        if self._session is not None:
+            await self._session.close()
+            self._session = None
+
+    def _load_cache(self, filename: str) -> Optional[Dict[str, Any]]:
+        """
+        读取未过期的缓存文件
+
+        Args:
+            filename: 缓存目录下的文件名
+
+        Returns:
+            缓存数据，未启用缓存、不存在、已过期或损坏时返回None
+        """
+        if not self.cfg.enable_cache:
+            return None
+
+        filepath = os.path.join(self.cfg.cache_dir, filename)
+        try:
+            # 按文件修改时间判断过期，过期文件无需读取和解析
+            if time.time() - os.path.getmtime(filepath) >= self.cfg.cache_expiry_hours * 3600:
+                return None
+            with open(filepath, 'r', encoding='utf-8') as f:
+                return json.load(f)
+        except FileNotFoundError:
+            return None
+        except (OSError, ValueError) as e:
+            logger.warning(f"读取缓存失败，忽略缓存: {filepath}, 错误: {e}")
+            return None
+
+    def _save_cache(self, filename: str, data: Dict[str, Any]) -> None:
+        """
+        原子写入缓存文件，避免进程中断时留下不完整的文件
+
+        Args:
+            filename: 缓存目录下的文件名
+            data: 要缓存的数据
+        """
+        if not self.cfg.enable_cache:
+            return
+
+        os.makedirs(self.cfg.cache_dir, exist_ok=True)
+        filepath = os.path.join(self.cfg.cache_dir, filename)
+        tmp_path = f"{filepath}.tmp"
+        try:
+            with open(tmp_path, 'w', encoding='utf-8') as f:
+                json.dump(data, f, ensure_ascii=False)
+            os.replace(tmp_path, filepath)
+        except OSError as e:
+            logger.warning(f"写入缓存失败: {filepath}, 错误: {e}")
+
+    def purge_stale_cache(self) -> int:
+        """
+        删除缓存目录中已过期的JSON缓存文件
+
+        HTTP缓存数据库（arxiv.sqlite）由 requests_cache 自行管理过期，不在此删除。
+
+        Returns:
+            删除的文件数
+        """
+        if not self.cfg.enable_cache:
+            return 0
+
+        expiry_ts = time.time() - self.cfg.cache_expiry_hours * 3600
+        removed = 0
+        try:
+            entries = list(os.scandir(self.cfg.cache_dir))
+        except FileNotFoundError:
+            return 0
+
+        for entry in entries:
+            try:
+                if entry.name.endswith('.json') and entry.is_file() and entry.stat().st_mtime < expiry_ts:
+                    os.remove(entry.path)
+                    removed += 1
+            except OSError as e:
+                logger.warning(f"删除过期缓存失败: {entry.path}, 错误: {e}")
+
+        if removed:
+            logger.info(f"已删除 {removed} 个过期缓存文件")
+        return removed
+
+    @staticmethod
+    def _summary_cache_name(paper_id: str) -> str:
+        """论文总结的缓存文件名，由论文ID和提示词版本决定"""
+        return f"{hashlib.sha1(f'{paper_id}|{PROMPT_VERSION}'.encode()).hexdigest()}.json"
+
+    @staticmethod
+    def _result_to_dict(paper: arxiv.Result) -> Dict[str, Any]:
+        """将arxiv结果转换为可缓存的字典"""
+        return {
+            "entry_id": paper.entry_id,
+            "updated": paper.updated.isoformat() if paper.updated else None,
+            "published": paper.published.isoformat(),
+            "title": paper.title,
+            "authors": [author.name for author in paper.authors],
+            "summary": paper.summary,
+            "primary_category": paper.primary_category,
+            "categories": paper.categories,
+            "pdf_url": paper.pdf_url,
+        }
+
+    @staticmethod
+    def _result_from_dict(data: Dict[str, Any]) -> arxiv.Result:
+        """从缓存的字典还原arxiv结果"""
+        links = [arxiv.Result.Link(data["pdf_url"], title="pdf")] if data["pdf_url"] else []
+        return arxiv.Result(
+            entry_id=data["entry_id"],
+            updated=datetime.fromisoformat(data["updated"]) if data["updated"] else None,
+            published=datetime.fromisoformat(data["published"]),
+            title=data["title"],
+            authors=[arxiv.Result.Author(name) for name in data["authors"]],
+            summary=data["summary"],
+            primary_category=data["primary_category"],
+            categories=data["categories"],
+            links=links,
+        )
+
+    def search_papers(self, days_back: int = 1, date_from: Optional[datetime] = None,
+                      date_to: Optional[datetime] = None) -> List[arxiv.Result]:
         """
         搜索arxiv上的相关论文
 
+        关键词和提交时间窗口合并为一个 submittedDate 查询，由arxiv客户端分页获取，
+        整个时间窗口通常只需一次请求。
+
         Args:
-            days_back: 搜索过去几天的论文
+            days_back: 搜索过去几天的论文，未指定date_from时使用
+            date_from: 时间窗口起点，不带时区时视为UTC，默认为date_to之前days_back天
+            date_to: 时间窗口终点，不带时区时视为UTC，默认为当前时间
 
         Returns:
             论文结果列表
         """
-        search_topic = self.search_topic if self.search_topic != "BOTH" else "VLM/VLA"
-        logger.info(f"开始搜索过去{days_back}天的{search_topic}相关论文...")
+        date_to = self._to_utc(date_to or datetime.now(timezone.utc))
+        date_from = self._to_utc(date_from) if date_from else date_to - timedelta(days=days_back)
+        search_topic = self.cfg.search_topic if self.cfg.search_topic != "BOTH" else "VLM/VLA"
+
+        # arxiv每天更新一次，截止日期和天数相同的查询直接使用缓存
+        window_days = (date_to.date() - date_from.date()).days
+        cache_name = f"arxiv_{date_to.strftime('%Y%m%d')}_{window_days}_{self.cfg.search_topic}.json"
+        cached = self._load_cache(cache_name)
+        if cached is not None:
+            papers = [self._result_from_dict(item) for item in cached['papers']]
+            logger.info(f"使用缓存的搜索结果，共 {len(papers)} 篇相关论文")
+            return papers
 
-        # 构建搜索查询
-        query_parts = []
-        for keyword in self.keywords:
-            query_parts.append(f'all:"{keyword}"')
+        logger.info(f"开始搜索 {date_from:%Y-%m-%d %H:%M} 至 {date_to:%Y-%m-%d %H:%M} (UTC) 的{search_topic}相关论文...")
 
-        query = " OR ".join(query_parts)
+        # 查询窗口向外取整到UTC整点：同一小时内查询URL不变，HTTP缓存可以命中；
+        # 多查到的首尾不足一小时的论文在返回后按精确窗口过滤
+        query_from = date_from.replace(minute=0, second=0, microsecond=0)
+        query_to = date_to.replace(minute=0, second=0, microsecond=0)
+        if query_to < date_to:
+            query_to += timedelta(hours=1)
 
-        # 设置时间范围
-        end_date = datetime.now()
-        start_date = end_date - timedelta(days=days_back)
+        # 构建搜索查询：关键词任一匹配，且提交时间在窗口内
+        keyword_query = " OR ".join(f'all:"{keyword}"' for keyword in self.cfg.search_keywords)
+        query = f"({keyword_query}) AND submittedDate:[{query_from:%Y%m%d%H%M} TO {query_to:%Y%m%d%H%M}]"
 
         try:
             # 搜索论文
-            print(query)
-            print(start_date)
+            logger.debug("arxiv查询: %s", query)
             search = arxiv.Search(
                 query=query,
-                max_results=50,  # 限制结果数量
+                max_results=self.cfg.max_results,  # 限制结果数量
                 sort_by=arxiv.SortCriterion.SubmittedDate,
                 sort_order=arxiv.SortOrder.Descending
             )
 
-            papers = []
-            for paper in search.results():
-                # 过滤时间范围
-                if paper.published.replace(tzinfo=None) >= start_date:
-                    papers.append(paper)
+            # 同一论文可能被多个关键词重复返回，只保留一次；只保留发布时间在精确窗口内的论文
+            papers = list({
+                paper.entry_id: paper for paper in self._arxiv_client.results(search)
+                if date_from <= paper.published <= date_to
+            }.values())
 
             logger.info(f"找到 {len(papers)} 篇相关论文")
+            self._save_cache(cache_name, {"papers": [self._result_to_dict(paper) for paper in papers]})
             return papers
 
         except Exception as e:
             logger.error(f"搜索论文时出错: {e}")
             return []
 
-    def _call_kimi_api(self, prompt: str, title: str, paper_id: str) -> str:
+    @staticmethod
+    def _to_utc(dt: datetime) -> datetime:
+        """转换为UTC时间，不带时区的时间视为UTC"""
+        return dt.astimezone(timezone.utc) if dt.tzinfo else dt.replace(tzinfo=timezone.utc)
+
+    async def _wait_for_rate_limit(self) -> None:
+        """等待到允许发起下一次Kimi请求，只补足距上次请求不足的间隔"""
+        async with self._rate_lock:
+            wait = max(0.0, self._next_allowed_ts - time.monotonic())
+            if wait > 0:
+                logger.debug("等待%.1f秒以避免API频率限制...", wait)
+                await asyncio.sleep(wait)
+            self._next_allowed_ts = time.monotonic() + self.cfg.kimi_request_delay
+
+    def _chat_payload(self, prompt: str) -> Dict[str, Any]:
+        """构建chat completions请求体，普通请求和批处理任务共用"""
+        return {
+            "model": "moonshot-v1-32k",
+            "messages": [
+                {"role": "user", "content": prompt}
+            ],
+            "temperature": 0.3
+        }
+
+    def _build_summary_prompt(self, paper_url: str) -> str:
+        """
+        构建单篇论文的总结提示词
+
+        Args:
+            paper_url: 论文PDF URL
+
+        Returns:
+            要求严格按照URL内容进行分析的Kimi提示词
+        """
+        return f"""请仔细阅读以下URL中的完整论文内容，并严格基于该论文的实际内容进行分析：
+
+论文URL: {paper_url}
+
+重要要求：
+1. 必须完整阅读URL中的论文全文
+2. 只能基于该URL论文的实际内容进行总结
+3. 不得添加任何URL论文中未提及的内容
+
+请按以下格式提供分析：
+
+【中文总结】
+用一句话概括该论文解决的核心问题，提出的主要方法和关键贡献：
+
+【English Summary】
+Core problem solved, main method proposed and key contribution in one sentence:
+
+注意：每个概括必须严格基于URL论文的实际内容，使用简洁明确的一句话表达，不得超出论文范围。"""
+
+    async def _call_kimi_api(self, prompt: str, title: str, paper_id: str) -> str:
         """
         调用Kimi API的基础方法
 
+        临时错误（429、5xx、超时、网络错误、200响应内容为空或格式异常）按带抖动的指数退避重试，
+        永久错误（400、401、403等4xx）直接抛出。
+
         Args:
             prompt: 提示词
             title: 论文标题（用于日志）
@@ -135,108 +448,212 @@ class ArxivPaperCrawler:
             API返回的内容
 
         Raises:
+            KimiTransientError: 当临时错误重试次数用尽时抛出
+            KimiAPIError: 当API调用失败时抛出
+        """
+        retrying = AsyncRetrying(
+            retry=retry_if_exception_type(KimiTransientError),
+            wait=wait_exponential_jitter(initial=self.cfg.retry_delay, max=300),
+            stop=stop_after_attempt(self.cfg.max_retry_attempts),
+            before_sleep=before_sleep_log(logger, logging.WARNING),
+            reraise=True,
+        )
+        async for attempt in retrying:
+            with attempt:
+                return await self._request_kimi(prompt, title, paper_id)
+
+    async def _request_kimi(self, prompt: str, title: str, paper_id: str) -> str:
+        """
+        发送一次Kimi chat completions请求，不做重试
+
+        Args:
+            prompt: 提示词
+            title: 论文标题（用于日志）
+            paper_id: 论文ID（用于错误报告）
+
+        Returns:
+            API返回的内容
+
+        Raises:
+            KimiTransientError: 当遇到可重试的临时错误时抛出
             KimiAPIError: 当API调用失败时抛出
         """
         try:
-            # 在API请求前添加等待，避免频率限制
-            logger.debug(f"等待{self.kimi_request_delay}秒以避免API频率限制...")
-            time.sleep(self.kimi_request_delay)
+            # 在API请求前限速，避免频率限制
+            await self._wait_for_rate_limit()
 
-            response = requests.post(
+            async with self._request_semaphore, self._session.post(
                 f"{self.kimi_base_url}/chat/completions",
-                headers=self.headers,
-                json={
-                    "model": "moonshot-v1-32k",
-                    "messages": [
-                        {"role": "user", "content": prompt}
-                    ],
-                    "temperature": 0.3
-                },
-                timeout=60
-            )
+                json=self._chat_payload(prompt),
+                timeout=aiohttp.ClientTimeout(total=60)
+            ) as response:
+                status_code = response.status
+                response_text = await response.text()
 
-            if response.status_code == 200:
-                result = response.json()
+            if status_code == 200:
+                result = json.loads(response_text)
 
                 # 检查响应是否包含错误
                 if 'error' in result:
                     error_msg = result['error'].get('message', '未知API错误')
-                    logger.error(f"API返回错误 - 论文: '{title}' (ID: {paper_id}), 错误: {error_msg}")
-                    raise KimiAPIError(title, paper_id, response.status_code, error_msg)
+                    logger.error("API返回错误 - 论文: '%s' (ID: %s), 错误: %s", title, paper_id, error_msg)
+                    raise KimiTransientError(title, paper_id, status_code, error_msg)
 
                 if 'choices' not in result or not result['choices']:
                     error_msg = "API响应格式异常，缺少choices字段"
-                    logger.error(f"API响应异常 - 论文: '{title}' (ID: {paper_id}), 错误: {error_msg}")
-                    raise KimiAPIError(title, paper_id, response.status_code, error_msg)
+                    logger.error("API响应异常 - 论文: '%s' (ID: %s), 错误: %s", title, paper_id, error_msg)
+                    raise KimiTransientError(title, paper_id, status_code, error_msg)
 
                 content = result['choices'][0]['message']['content'].strip()
 
                 # 检查内容是否为空
                 if not content:
                     error_msg = "API返回空内容"
-                    logger.error(f"API返回空内容 - 论文: '{title}' (ID: {paper_id})")
-                    raise KimiAPIError(title, paper_id, response.status_code, error_msg)
+                    logger.error("API返回空内容 - 论文: '%s' (ID: %s)", title, paper_id)
+                    raise KimiTransientError(title, paper_id, status_code, error_msg)
 
                 return content
             else:
                 # 处理HTTP错误
                 error_msg = "HTTP请求失败"
                 try:
-                    error_response = response.json()
+                    error_response = json.loads(response_text)
                     if 'error' in error_response:
                         error_msg = error_response['error'].get('message', error_msg)
                 except:
-                    error_msg = f"HTTP {response.status_code}: {response.text[:200] if response.text else '无响应内容'}"
+                    error_msg = f"HTTP {status_code}: {response_text[:200] if response_text else '无响应内容'}"
 
-                logger.error(f"Kimi API请求失败 - 论文: '{title}' (ID: {paper_id}), 状态码: {response.status_code}, 错误: {error_msg}")
+                logger.error("Kimi API请求失败 - 论文: '%s' (ID: %s), 状态码: %s, 错误: %s", title, paper_id, status_code, error_msg)
 
                 # 根据状态码提供更具体的错误信息
-                if response.status_code == 400:
+                if status_code == 400:
                     error_msg += " (可能是PDF URL无法访问或格式不支持)"
-                elif response.status_code == 401:
+                elif status_code == 401:
                     error_msg += " (API密钥无效或已过期)"
-                elif response.status_code == 403:
+                elif status_code == 403:
                     error_msg += " (API访问被拒绝，可能是权限不足)"
-                elif response.status_code == 429:
+                elif status_code == 429:
                     error_msg += " (API调用频率超限，请稍后重试)"
-                elif response.status_code >= 500:
+                elif status_code >= 500:
                     error_msg += " (服务器内部错误)"
 
-                raise KimiAPIError(title, paper_id, response.status_code, error_msg)
+                # 频率超限和服务器错误可重试，其余状态码重试也不会成功
+                if status_code == 429 or status_code >= 500:
+                    raise KimiTransientError(title, paper_id, status_code, error_msg)
+                raise KimiAPIError(title, paper_id, status_code, error_msg)
+
+        except KimiAPIError:
+            raise
 
-        except requests.exceptions.Timeout:
+        except asyncio.TimeoutError:
             error_msg = "请求超时，可能是PDF文件过大或网络连接不稳定"
-            logger.error(f"API请求超时 - 论文: '{title}' (ID: {paper_id}), 错误: {error_msg}")
-            raise KimiAPIError(title, paper_id, None, error_msg)
+            logger.error("API请求超时 - 论文: '%s' (ID: %s), 错误: %s", title, paper_id, error_msg)
+            raise KimiTransientError(title, paper_id, None, error_msg)
 
-        except requests.exceptions.ConnectionError:
+        except aiohttp.ClientConnectionError:
             error_msg = "网络连接错误，无法连接到Kimi API服务器"
-            logger.error(f"网络连接失败 - 论文: '{title}' (ID: {paper_id}), 错误: {error_msg}")
-            raise KimiAPIError(title, paper_id, None, error_msg)
+            logger.error("网络连接失败 - 论文: '%s' (ID: %s), 错误: %s", title, paper_id, error_msg)
+            raise KimiTransientError(title, paper_id, None, error_msg)
 
-        except requests.exceptions.RequestException as e:
+        except aiohttp.ClientError as e:
             error_msg = f"请求异常: {str(e)}"
-            logger.error(f"请求异常 - 论文: '{title}' (ID: {paper_id}), 错误: {error_msg}")
-            raise KimiAPIError(title, paper_id, None, error_msg)
+            logger.error("请求异常 - 论文: '%s' (ID: %s), 错误: %s", title, paper_id, error_msg)
+            raise KimiTransientError(title, paper_id, None, error_msg)
+
+        except (ValueError, KeyError, IndexError, TypeError, AttributeError) as e:
+            # 200响应无法解析为JSON或结构不符，多为服务端偶发问题，可重试
+            error_msg = f"API响应格式异常: {str(e)}"
+            logger.error("API响应异常 - 论文: '%s' (ID: %s), 错误: %s", title, paper_id, error_msg)
+            raise KimiTransientError(title, paper_id, None, error_msg)
 
         except Exception as e:
             error_msg = f"未知错误: {str(e)}"
-            logger.error(f"未知错误 - 论文: '{title}' (ID: {paper_id}), 错误: {error_msg}")
-            raise KimiAPIError(title, paper_id, None, error_msg)
+            logger.error("未知错误 - 论文: '%s' (ID: %s), 错误: %s", title, paper_id, error_msg)
+            raise KimiTransientError(title, paper_id, None, error_msg)
+
+    def _looks_suspicious(self, summary_dict: Dict[str, str], abstract: str) -> bool:
+        """
+        本地检查总结是否可疑，只有可疑的总结才需要调用Kimi验证
+
+        Args:
+            summary_dict: 生成的总结
+            abstract: arxiv论文摘要
+
+        Returns:
+            总结是否可疑
+        """
+        chinese_summary = summary_dict['chinese_summary']
+        english_summary = summary_dict['english_summary']
+
+        if len(chinese_summary) < 30:
+            return True
+
+        if any(marker in chinese_summary or marker in english_summary for marker in SUMMARY_FAILURE_MARKERS):
+            return True
+
+        # 英文总结与摘要的词频相似度过低，可能与论文内容无关
+        if abstract and self._summary_similarity(english_summary, abstract) < self.cfg.verification_similarity_threshold:
+            return True
+
+        return False
 
-    def _verify_summary(self, paper_url: str, original_summary: Dict[str, str], title: str, paper_id: str) -> bool:
+    @staticmethod
+    def _summary_similarity(summary: str, abstract: str) -> float:
         """
-        验证生成的总结是否准确
+        计算英文总结与摘要的词频余弦相似度
+
+        Args:
+            summary: 英文总结
+            abstract: arxiv论文摘要
+
+        Returns:
+            余弦相似度 (0-1)
+        """
+        summary_counts = ArxivPaperCrawler._content_word_counts(summary)
+        abstract_counts = ArxivPaperCrawler._content_word_counts(abstract)
+        if not summary_counts or not abstract_counts:
+            return 0.0
+
+        dot = sum(count * abstract_counts[word] for word, count in summary_counts.items())
+        norm = (sum(c * c for c in summary_counts.values()) * sum(c * c for c in abstract_counts.values())) ** 0.5
+        return dot / norm
+
+    @staticmethod
+    def _content_word_counts(text: str) -> Counter:
+        """
+        统计文本中的实词词频，去掉停用词并把复数简单还原为单数
+
+        Args:
+            text: 英文文本
+
+        Returns:
+            实词到出现次数的计数
+        """
+        return Counter(
+            word[:-1] if len(word) > 4 and word.endswith('s') and not word.endswith('ss') else word
+            for word in WORD_RE.findall(text.lower())
+            if word not in SIMILARITY_STOPWORDS
+        )
+
+    async def _verify_summary(self, paper_url: str, original_summary: Dict[str, str], title: str, paper_id: str,
+                              abstract: str = "") -> bool:
+        """
+        验证生成的总结是否准确，本地一致性检查通过时不再调用Kimi
 
         Args:
             paper_url: 论文PDF URL
             original_summary: 原始总结
             title: 论文标题
             paper_id: 论文ID
+            abstract: arxiv论文摘要（用于本地一致性检查）
 
         Returns:
             验证是否通过
         """
+        if not self._looks_suspicious(original_summary, abstract):
+            logger.info("✅ 本地一致性检查通过 - 论文: '%s' (ID: %s)", title, paper_id)
+            return True
+
         verification_prompt = f"""请仔细阅读以下URL中的论文内容，并验证给出的总结是否准确：
 
 论文URL: {paper_url}
@@ -250,32 +667,39 @@ class ArxivPaperCrawler:
 2. 总结是否准确反映了论文的核心问题、方法和贡献
 3. 总结中是否包含了论文中未提及的内容
 
-请回答：
-验证结果：通过/不通过
-原因：[如果不通过，请说明具体原因]"""
+请只返回如下JSON，不要输出其他内容：
+{{"pass": true或false, "reason": "如果不通过，请说明具体原因"}}"""
 
         try:
-            logger.info(f"开始验证论文总结 - 论文: '{title}' (ID: {paper_id})")
-            logger.debug(f"等待{self.verification_delay}秒后进行验证...")
-            time.sleep(self.verification_delay)
+            # 验证请求与总结请求共享限速器，无需额外等待
+            logger.info("开始验证论文总结 - 论文: '%s' (ID: %s)", title, paper_id)
+            verification_content = await self._call_kimi_api(verification_prompt, title, paper_id)
 
-            verification_content = self._call_kimi_api(verification_prompt, title, paper_id)
+            # 解析JSON格式的验证结果，兼容模型在JSON外包裹的代码块等内容
+            start = verification_content.find('{')
+            end = verification_content.rfind('}')
+            try:
+                verdict = json.loads(verification_content[start:end + 1])
+                passed = verdict.get('pass') is True
+                reason = verdict.get('reason', '')
+            except (ValueError, AttributeError):
+                logger.warning("无法解析验证结果，默认通过 - 论文: '%s' (ID: %s), 内容: %s", title, paper_id, verification_content[:200])
+                return True
 
-            # 解析验证结果
-            if "通过" in verification_content and "不通过" not in verification_content:
-                logger.info(f"✅ 验证通过 - 论文: '{title}' (ID: {paper_id})")
+            if passed:
+                logger.info("✅ 验证通过 - 论文: '%s' (ID: %s)", title, paper_id)
                 return True
             else:
-                logger.warning(f"❌ 验证不通过 - 论文: '{title}' (ID: {paper_id})")
-                logger.warning(f"验证详情: {verification_content}")
+                logger.warning("❌ 验证不通过 - 论文: '%s' (ID: %s)", title, paper_id)
+                logger.warning("验证详情: %s", reason)
                 return False
 
         except Exception as e:
-            logger.error(f"验证过程出错 - 论文: '{title}' (ID: {paper_id}), 错误: {str(e)}")
+            logger.error("验证过程出错 - 论文: '%s' (ID: %s), 错误: %s", title, paper_id, e)
             # 验证失败时默认认为通过，避免阻塞流程
             return True
 
-    def summarize_with_kimi(self, paper_url: str, title: str, paper_id: str) -> Dict[str, str]:
+    async def summarize_with_kimi(self, paper_url: str, title: str, paper_id: str, abstract: str = "") -> Dict[str, str]:
         """
         使用Kimi API通过论文URL分析论文内容，支持验证和重试
 
@@ -283,6 +707,7 @@ class ArxivPaperCrawler:
             paper_url: 论文PDF URL
             title: 论文标题（用于日志）
             paper_id: 论文ID（用于错误报告）
+            abstract: arxiv论文摘要（用于判断总结是否需要验证）
 
         Returns:
             包含中英文论文总结的字典，格式为：
@@ -292,114 +717,360 @@ class ArxivPaperCrawler:
         Raises:
             KimiAPIError: 当API调用失败时抛出
         """
-        # 优化的Kimi提示词，要求严格按照URL内容进行分析
-        url_prompt = f"""请仔细阅读以下URL中的完整论文内容，并严格基于该论文的实际内容进行分析：
-
-论文URL: {paper_url}
-
-重要要求：
-1. 必须完整阅读URL中的论文全文
-2. 只能基于该URL论文的实际内容进行总结
-3. 不得添加任何URL论文中未提及的内容
+        url_prompt = self._build_summary_prompt(paper_url)
+
+        # 同一论文在提示词不变时总结结果稳定，优先使用缓存
+        cache_name = self._summary_cache_name(paper_id)
+        cached = self._load_cache(cache_name)
+        if cached is not None:
+            logger.info("使用缓存的论文总结 - 论文: '%s' (ID: %s)", title, paper_id)
+            return {
+                "chinese_summary": cached["chinese_summary"],
+                "english_summary": cached["english_summary"]
+            }
+
+        summary_dict, verified = await self._generate_summary(url_prompt, paper_url, title, paper_id, abstract)
+        # 验证未通过的总结不缓存，下次运行时重新生成
+        if verified:
+            self._cache_summary(paper_id, summary_dict)
+        return summary_dict
+
+    def _cache_summary(self, paper_id: str, summary_dict: Dict[str, str]) -> None:
+        """
+        缓存论文总结，包含解析失败占位内容的总结不缓存
 
-请按以下格式提供分析：
+        Args:
+            paper_id: 论文ID
+            summary_dict: 中英文总结字典
+        """
+        if any(marker in text for text in summary_dict.values() for marker in SUMMARY_FAILURE_MARKERS):
+            return
+        self._save_cache(self._summary_cache_name(paper_id), summary_dict)
 
-【中文总结】
-用一句话概括该论文解决的核心问题，提出的主要方法和关键贡献：
+    async def _generate_summary(self, url_prompt: str, paper_url: str, title: str, paper_id: str,
+                                abstract: str) -> Tuple[Dict[str, str], bool]:
+        """
+        调用Kimi API生成总结，支持验证和重试
 
-【English Summary】
-Core problem solved, main method proposed and key contribution in one sentence:
+        Args:
+            url_prompt: 总结提示词
+            paper_url: 论文PDF URL
+            title: 论文标题（用于日志）
+            paper_id: 论文ID（用于错误报告）
+            abstract: arxiv论文摘要（用于判断总结是否需要验证）
 
-注意：每个概括必须严格基于URL论文的实际内容，使用简洁明确的一句话表达，不得超出论文范围。"""
+        Returns:
+            (中英文论文总结字典, 是否通过验证)，未启用验证时视为通过
 
-        logger.info(f"正在通过URL分析论文内容: {title} (ID: {paper_id})")
-        logger.debug(f"PDF URL: {paper_url}")
+        Raises:
+            KimiAPIError: 当API调用失败时抛出
+        """
+        logger.info("正在通过URL分析论文内容: %s (ID: %s)", title, paper_id)
+        logger.debug("PDF URL: %s", paper_url)
 
-        # 尝试生成和验证总结
-        for attempt in range(self.max_verification_attempts):
-            try:
-                logger.info(f"第 {attempt + 1} 次尝试生成总结 - 论文: '{title}' (ID: {paper_id})")
+        # 尝试生成和验证总结：解析失败或验证不通过时重新生成，API错误的重试由 _call_kimi_api 负责
+        for attempt in range(self.cfg.max_verification_attempts):
+            logger.info("第 %s 次尝试生成总结 - 论文: '%s' (ID: %s)", attempt + 1, title, paper_id)
 
-                # 调用API生成总结
-                content = self._call_kimi_api(url_prompt, title, paper_id)
+            # 调用API生成总结
+            content = await self._call_kimi_api(url_prompt, title, paper_id)
 
-                # 解析中英文总结
-                chinese_summary = ""
-                english_summary = ""
+            # 解析中英文总结，无英文分隔符时整个内容作为中文总结
+            match = SUMMARY_RE.match(content)
+            chinese_summary = match.group('zh').strip()
+            english_summary = (match.group('en') or "").strip()
 
-                # 尝试按分割符分割内容
-                if '【English Summary】' in content:
-                    parts = content.split('【English Summary】')
-                elif 'English Summary' in content:
-                    parts = content.split('English Summary')
+            # 检查解析结果
+            if not chinese_summary and not english_summary:
+                if attempt < self.cfg.max_verification_attempts - 1:
+                    logger.warning("解析失败，将重试 - 论文: '%s' (ID: %s)", title, paper_id)
+                    continue
                 else:
-                    parts = [content, ""]
-
-                if len(parts) >= 2:
-                    # 提取中文部分
-                    chinese_part = parts[0].replace('【中文总结】', '').replace('中文总结', '').strip()
-                    # 提取英文部分
-                    english_part = parts[1].strip()
-
-                    # 清理内容
-                    chinese_summary = chinese_part if chinese_part else ""
-                    english_summary = english_part if english_part else ""
+                    error_msg = f"无法解析API返回内容，原始内容: {content[:200]}..."
+                    logger.error("内容解析失败 - 论文: '%s' (ID: %s), 错误: %s", title, paper_id, error_msg)
+                    raise KimiAPIError(title, paper_id, None, error_msg, paper_url)
+
+            # 确保有内容
+            chinese_summary = chinese_summary or "解析失败，无法获取论文总结"
+            english_summary = english_summary or "Parsing failed, unable to get paper summary"
+
+            # 构建总结字典
+            summary_dict = {
+                "chinese_summary": chinese_summary,
+                "english_summary": english_summary
+            }
+
+            # 如果启用验证功能，进行验证（本地检查通过时不调用API）
+            if self.cfg.enable_verification:
+                is_valid = await self._verify_summary(paper_url, summary_dict, title, paper_id, abstract)
+                if is_valid:
+                    logger.info("✅ 总结验证通过 - 论文: '%s' (ID: %s)", title, paper_id)
+                    return summary_dict, True
                 else:
-                    # 如果无法分割，将整个内容作为中文总结
-                    chinese_summary = content.replace('【中文总结】', '').replace('中文总结', '').strip()
-                    english_summary = ""
-
-                # 检查解析结果
-                if not chinese_summary and not english_summary:
-                    if attempt < self.max_verification_attempts - 1:
-                        logger.warning(f"解析失败，将重试 - 论文: '{title}' (ID: {paper_id})")
+                    if attempt < self.cfg.max_verification_attempts - 1:
+                        logger.warning("🔄 验证不通过，将重新生成 - 论文: '%s' (ID: %s)", title, paper_id)
                         continue
                     else:
-                        error_msg = f"无法解析API返回内容，原始内容: {content[:200]}..."
-                        logger.error(f"内容解析失败 - 论文: '{title}' (ID: {paper_id}), 错误: {error_msg}")
-                        raise KimiAPIError(title, paper_id, None, error_msg, paper_url)
+                        logger.warning("⚠️  验证不通过但已达最大重试次数，使用当前结果 - 论文: '%s' (ID: %s)", title, paper_id)
+                        return summary_dict, False
+            else:
+                # 未启用验证，直接返回结果
+                logger.info("成功分析论文内容 - 论文: '%s' (ID: %s)", title, paper_id)
+                return summary_dict, True
+
+        # 如果所有尝试都失败了
+        error_msg = f"经过 {self.cfg.max_verification_attempts} 次尝试仍无法生成有效总结"
+        logger.error("生成总结失败 - 论文: '%s' (ID: %s), 错误: %s", title, paper_id, error_msg)
+        raise KimiAPIError(title, paper_id, None, error_msg, paper_url)
+
+    async def summarize_batch(self, papers: List[arxiv.Result]) -> List[Dict[str, str]]:
+        """
+        用一次Kimi请求批量总结多篇论文
+
+        缓存命中的论文不再请求，已有批处理任务结果的论文直接使用该结果；
+        批量结果缺失、解析失败或（启用验证时）可疑的论文回退为逐篇调用 summarize_with_kimi。
+
+        Args:
+            papers: arxiv论文结果列表
+
+        Returns:
+            与papers顺序一致的中英文总结字典列表
 
-                # 确保有内容
-                chinese_summary = chinese_summary or "解析失败，无法获取论文总结"
-                english_summary = english_summary or "Parsing failed, unable to get paper summary"
+        Raises:
+            KimiAPIError: 当逐篇回退的API调用失败时抛出
+        """
+        paper_ids = [paper.entry_id.split('/')[-1] for paper in papers]
+        summaries: Dict[str, Dict[str, str]] = {}
+
+        pending = []
+        for paper, paper_id in zip(papers, paper_ids):
+            cached = self._load_cache(self._summary_cache_name(paper_id))
+            if cached is not None:
+                logger.info("使用缓存的论文总结 - 论文: '%s' (ID: %s)", paper.title.strip(), paper_id)
+                summaries[paper_id] = {
+                    "chinese_summary": cached["chinese_summary"],
+                    "english_summary": cached["english_summary"]
+                }
+            else:
+                pending.append((paper, paper_id))
+
+        if pending:
+            # 批处理任务的结果与批量请求结果同等对待，只请求剩余的论文
+            batch_summaries = {
+                paper_id: self._prefetched_summaries.pop(paper_id)
+                for _, paper_id in pending if paper_id in self._prefetched_summaries
+            }
+            to_request = [(paper, paper_id) for paper, paper_id in pending if paper_id not in batch_summaries]
+            if len(to_request) > 1:
+                try:
+                    batch_summaries.update(await self._request_batch_summary(to_request))
+                except KimiAPIError as e:
+                    logger.warning("批量总结失败，回退为逐篇总结: %s", e)
+
+            for paper, paper_id in pending:
+                summary = batch_summaries.get(paper_id)
+                if summary is None:
+                    continue
+                if self.cfg.enable_verification and self._looks_suspicious(summary, paper.summary):
+                    logger.info("批量总结结果可疑，改为逐篇总结并验证 - 论文: '%s' (ID: %s)", paper.title.strip(), paper_id)
+                    continue
+                summaries[paper_id] = summary
+                self._cache_summary(paper_id, summary)
+
+        for paper, paper_id in pending:
+            if paper_id not in summaries:
+                summaries[paper_id] = await self.summarize_with_kimi(
+                    paper.pdf_url, paper.title.strip(), paper_id, paper.summary
+                )
+
+        return [summaries[paper_id] for paper_id in paper_ids]
+
+    async def _request_batch_summary(self, pending: List[tuple]) -> Dict[str, Dict[str, str]]:
+        """
+        发送批量总结请求并解析返回的JSON数组
+
+        Args:
+            pending: (论文, 论文ID) 列表
+
+        Returns:
+            论文ID到中英文总结的映射，解析失败或缺失的论文不包含在内
+
+        Raises:
+            KimiAPIError: 当API调用失败时抛出
+        """
+        paper_list = "\n".join(
+            f"{i + 1}. ID: {paper_id}\n   URL: {paper.pdf_url}"
+            for i, (paper, paper_id) in enumerate(pending)
+        )
+        batch_prompt = f"""请仔细阅读以下每个URL中的完整论文内容，并严格基于各论文的实际内容分别进行分析：
+
+{paper_list}
 
-                # 构建总结字典
-                summary_dict = {
+重要要求：
+1. 必须完整阅读每个URL中的论文全文
+2. 每篇论文的总结只能基于该论文的实际内容，不得混淆不同论文
+3. 不得添加任何URL论文中未提及的内容
+
+请只返回如下格式的JSON数组，每篇论文一项，不要输出其他内容：
+[{{"id": "论文ID", "chinese_summary": "用一句话概括该论文解决的核心问题，提出的主要方法和关键贡献", "english_summary": "Core problem solved, main method proposed and key contribution in one sentence"}}]
+
+注意：每个概括必须严格基于对应URL论文的实际内容，使用简洁明确的一句话表达，不得超出论文范围。"""
+
+        batch_title = f"批量总结({len(pending)}篇)"
+        batch_ids = ", ".join(paper_id for _, paper_id in pending)
+        logger.info("正在批量分析论文内容 - %s (ID: %s)", batch_title, batch_ids)
+        content = await self._call_kimi_api(batch_prompt, batch_title, batch_ids)
+
+        # 取第一个 [ 到最后一个 ] 之间的内容，兼容模型在JSON外包裹的代码块等内容
+        start = content.find('[')
+        end = content.rfind(']')
+        try:
+            items = orjson.loads(content[start:end + 1])
+        except orjson.JSONDecodeError:
+            logger.warning("无法解析批量总结结果 - %s (ID: %s), 内容: %s", batch_title, batch_ids, content[:200])
+            return {}
+
+        summaries = {}
+        for item in items if isinstance(items, list) else []:
+            if not isinstance(item, dict):
+                continue
+            chinese_summary = str(item.get('chinese_summary') or "").strip()
+            english_summary = str(item.get('english_summary') or "").strip()
+            if chinese_summary and english_summary:
+                summaries[str(item.get('id', '')).strip()] = {
                     "chinese_summary": chinese_summary,
                     "english_summary": english_summary
                 }
+        return summaries
 
-                # 如果启用验证功能，进行验证
-                if self.enable_verification:
-                    is_valid = self._verify_summary(paper_url, summary_dict, title, paper_id)
-                    if is_valid:
-                        logger.info(f"✅ 总结验证通过 - 论文: '{title}' (ID: {paper_id})")
-                        return summary_dict
-                    else:
-                        if attempt < self.max_verification_attempts - 1:
-                            logger.warning(f"🔄 验证不通过，将重新生成 - 论文: '{title}' (ID: {paper_id})")
-                            continue
-                        else:
-                            logger.warning(f"⚠️  验证不通过但已达最大重试次数，使用当前结果 - 论文: '{title}' (ID: {paper_id})")
-                            return summary_dict
-                else:
-                    # 未启用验证，直接返回结果
-                    logger.info(f"成功分析论文内容 - 论文: '{title}' (ID: {paper_id})")
-                    return summary_dict
-
-            except KimiAPIError:
-                # 如果是API错误且还有重试机会，继续重试
-                if attempt < self.max_verification_attempts - 1:
-                    logger.warning(f"API调用失败，将重试 - 论文: '{title}' (ID: {paper_id})")
+    async def _batch_api_request(self, method: str, path: str, raw: bool = False, **kwargs) -> Any:
+        """
+        调用Kimi批处理任务相关接口（文件上传、任务创建与查询、结果下载）
+
+        Args:
+            method: HTTP方法
+            path: 相对于Kimi API基础URL的路径
+            raw: 为True时返回响应文本，否则解析为JSON
+            **kwargs: 透传给 aiohttp 的请求参数
+
+        Returns:
+            响应文本或解析后的JSON对象
+
+        Raises:
+            KimiAPIError: 当请求失败或响应不是JSON对象时抛出
+        """
+        try:
+            async with self._session.request(
+                method,
+                f"{self.kimi_base_url}{path}",
+                timeout=aiohttp.ClientTimeout(total=120),
+                **kwargs
+            ) as response:
+                status_code = response.status
+                response_text = await response.text()
+        except (asyncio.TimeoutError, aiohttp.ClientError) as e:
+            raise KimiAPIError("批处理任务", path, None, f"请求异常: {e}")
+
+        if status_code != 200:
+            raise KimiAPIError("批处理任务", path, status_code, f"HTTP {status_code}: {response_text[:200]}")
+        if raw:
+            return response_text
+        try:
+            result = orjson.loads(response_text)
+        except orjson.JSONDecodeError:
+            result = None
+        if not isinstance(result, dict):
+            raise KimiAPIError("批处理任务", path, status_code, f"响应格式异常: {response_text[:200]}")
+        return result
+
+    async def _run_batch_job(self, papers: List[arxiv.Result]) -> Dict[str, Dict[str, str]]:
+        """
+        通过Kimi批处理任务接口一次提交所有论文的总结请求
+
+        上传JSONL请求文件（每篇论文一行）并创建批处理任务，按指数退避轮询任务状态，
+        完成后下载结果文件并解析。
+
+        Args:
+            papers: 需要总结的arxiv论文列表
+
+        Returns:
+            论文ID到中英文总结的映射，失败或解析失败的论文不包含在内
+
+        Raises:
+            KimiAPIError: 当任务提交失败、响应缺少必要字段、执行失败或超时未完成时抛出
+        """
+        lines = [
+            orjson.dumps({
+                "custom_id": paper.entry_id.split('/')[-1],
+                "method": "POST",
+                "url": "/v1/chat/completions",
+                "body": self._chat_payload(self._build_summary_prompt(paper.pdf_url))
+            })
+            for paper in papers
+        ]
+        form = aiohttp.FormData()
+        form.add_field("purpose", "batch")
+        form.add_field("file", b"\n".join(lines), filename="arxiv_papers.jsonl", content_type="application/jsonl")
+        input_file = await self._batch_api_request("POST", "/files", data=form)
+        input_file_id = input_file.get("id")
+        if not input_file_id:
+            raise KimiAPIError("批处理任务", "/files", None, "上传请求文件的响应中缺少文件ID")
+
+        job = await self._batch_api_request("POST", "/batches", json={
+            "input_file_id": input_file_id,
+            "endpoint": "/v1/chat/completions",
+            "completion_window": "24h"
+        })
+        job_id = job.get("id")
+        if not job_id:
+            raise KimiAPIError("批处理任务", "/batches", None, "创建任务的响应中缺少任务ID")
+        logger.info("已提交Kimi批处理任务 %s，共 %s 篇论文", job_id, len(lines))
+
+        # 轮询间隔从10秒开始翻倍，最长5分钟
+        deadline = time.monotonic() + self.cfg.kimi_batch_job_timeout
+        delay = 10.0
+        while job.get("status") not in ("completed", "failed", "expired", "cancelled"):
+            if time.monotonic() + delay > deadline:
+                # 尽力取消任务，避免回退为普通请求后服务端仍在执行并计费
+                try:
+                    await self._batch_api_request("POST", f"/batches/{job_id}/cancel")
+                except KimiAPIError as e:
+                    logger.warning("取消Kimi批处理任务 %s 失败: %s", job_id, e)
+                raise KimiAPIError("批处理任务", job_id, None, f"任务在 {self.cfg.kimi_batch_job_timeout} 秒内未完成")
+            await asyncio.sleep(delay)
+            delay = min(delay * 2, 300.0)
+            job = await self._batch_api_request("GET", f"/batches/{job_id}")
+            logger.debug("批处理任务 %s 状态: %s", job_id, job.get("status"))
+
+        if job.get("status") != "completed" or not job.get("output_file_id"):
+            raise KimiAPIError("批处理任务", job_id, None, f"任务未成功完成，状态: {job.get('status')}")
+
+        output = await self._batch_api_request("GET", f"/files/{job['output_file_id']}/content", raw=True)
+        summaries = {}
+        for line in output.splitlines():
+            if not line.strip():
+                continue
+            # 结果行格式异常时只跳过该论文，由普通请求补齐
+            try:
+                item = orjson.loads(line)
+                paper_id = item["custom_id"]
+                if item["response"]["status_code"] != 200:
                     continue
-                else:
-                    # 最后一次尝试失败，抛出异常
-                    raise
+                content = item["response"]["body"]["choices"][0]["message"]["content"].strip()
+            except (orjson.JSONDecodeError, KeyError, IndexError, TypeError, AttributeError):
+                continue
 
-        # 如果所有尝试都失败了
-        error_msg = f"经过 {self.max_verification_attempts} 次尝试仍无法生成有效总结"
-        logger.error(f"生成总结失败 - 论文: '{title}' (ID: {paper_id}), 错误: {error_msg}")
-        raise KimiAPIError(title, paper_id, None, error_msg, paper_url)
+            match = SUMMARY_RE.match(content)
+            chinese_summary = match.group('zh').strip()
+            english_summary = (match.group('en') or "").strip()
+            if chinese_summary and english_summary:
+                summaries[paper_id] = {
+                    "chinese_summary": chinese_summary,
+                    "english_summary": english_summary
+                }
+
+        logger.info("Kimi批处理任务 %s 完成，获得 %s/%s 篇论文总结", job_id, len(summaries), len(lines))
+        return summaries
 
     def _get_default_summary(self) -> Dict[str, str]:
         """返回默认的总结格式"""
@@ -407,88 +1078,159 @@ Core problem solved, main method proposed and key contribution in one sentence:
             "chinese_summary": "API调用失败或PDF无法访问，无法分析论文内容",
             "english_summary": "API call failed or PDF inaccessible, unable to analyze paper content"
         }
-    def process_papers(self, papers: List[arxiv.Result]) -> List[Dict[str, Any]]:
+    async def process_papers(self, papers: List[arxiv.Result]) -> List[PaperRecord]:
         """
-        处理论文列表，生成标准化的字典格式
+        并发处理论文列表，生成标准化的论文记录
 
         Args:
             papers: arxiv论文结果列表
 
         Returns:
-            标准化的论文信息字典列表
+            标准化的论文记录列表
 
         Raises:
             PaperProcessingError: 当论文处理失败时抛出
         """
-        processed_papers = []
         failed_papers = []
         filtered_papers = []  # 被过滤掉的低相关性论文
+        excluded_count = 0  # 因分类被排除的论文数
+
+        # 本次处理的所有论文共用同一个抓取时间戳
+        self._crawl_ts = datetime.now().isoformat()
 
-        for i, paper in enumerate(papers):
+        # 先计算相关性分数，进行预过滤
+        candidates = []
+        for paper in papers:
             paper_id = paper.entry_id.split('/')[-1]
             paper_title = paper.title.strip()
 
-            logger.info(f"处理论文 {i+1}/{len(papers)}: {paper_title} (ID: {paper_id})")
+            # 主分类属于排除分类的论文直接跳过，不计算相关性也不调用API
+            if paper.primary_category in self.cfg.exclude_categories:
+                logger.info("⚠️  论文主分类 %s 已被排除，跳过处理: %s (ID: %s)", paper.primary_category, paper_title, paper_id)
+                excluded_count += 1
+                continue
 
-            # 先计算相关性分数，进行预过滤
             relevance_score = self._calculate_relevance_score(paper.title, paper.summary)
-            logger.debug(f"论文相关性分数: {relevance_score:.3f}")
+            logger.debug("论文相关性分数: %.3f - %s (ID: %s)", relevance_score, paper_title, paper_id)
 
             # 如果相关性分数低于阈值，跳过处理
-            if relevance_score < self.min_relevance_score:
-                logger.info(f"⚠️  论文相关性分数 {relevance_score:.3f} 低于阈值 {self.min_relevance_score}，跳过处理: {paper_title} (ID: {paper_id})")
+            if relevance_score < self.cfg.min_relevance_score:
+                logger.info("⚠️  论文相关性分数 %.3f 低于阈值 %s，跳过处理: %s (ID: %s)", relevance_score, self.cfg.min_relevance_score, paper_title, paper_id)
                 filtered_papers.append({
                     "paper_id": paper_id,
                     "paper_title": paper_title,
                     "relevance_score": relevance_score,
-                    "reason": f"相关性分数 {relevance_score:.3f} < {self.min_relevance_score}"
+                    "reason": f"相关性分数 {relevance_score:.3f} < {self.cfg.min_relevance_score}"
                 })
                 continue
 
-            try:
-                # 使用Kimi通过URL分析论文内容
-                summary = self.summarize_with_kimi(paper.pdf_url, paper_title, paper_id)
-                # 构建标准化字典
-                paper_dict = {
-                    "id": paper_id,
-                    "title": paper_title,
-                    "authors": [author.name for author in paper.authors],
-                    "published_date": paper.published.strftime("%Y-%m-%d"),
-                    "updated_date": paper.updated.strftime("%Y-%m-%d") if paper.updated else None,
-                    "categories": paper.categories,
-                    "primary_category": paper.primary_category,
-                    "pdf_url": paper.pdf_url,
-                    "arxiv_url": paper.entry_id,
-                    "summary": {
-                        "chinese_summary": summary["chinese_summary"],
-                        "english_summary": summary["english_summary"]
-                    },
-                    "crawl_timestamp": datetime.now().isoformat(),
-                    "relevance_score": relevance_score,
-                    "processing_status": "success"
-                }
+            candidates.append((paper, relevance_score))
 
-                processed_papers.append(paper_dict)
-                logger.info(f"✅ 成功处理论文: {paper_title} (ID: {paper_id}), 相关性: {relevance_score:.3f}")
+        # 按相关性从高到低处理：信号量按创建顺序放行批次，最相关的论文最先总结
+        candidates.sort(key=itemgetter(1), reverse=True)
 
-            except KimiAPIError as e:
-                # 记录API调用失败的详细信息
-                logger.error(f"❌ Kimi API调用失败: {str(e)}")
-                failed_papers.append({
-                    "paper_id": paper_id,
-                    "paper_title": paper_title,
-                    "error_type": "KimiAPIError",
-                    "error_message": str(e),
-                    "pdf_url": paper.pdf_url,
-                    "relevance_score": relevance_score
-                })
+        # 启用批处理任务时，先把所有未缓存的论文作为一个任务提交；失败时回退为普通请求
+        if self.cfg.kimi_batch_job:
+            uncached = [
+                paper for paper, _ in candidates
+                if self._load_cache(self._summary_cache_name(paper.entry_id.split('/')[-1])) is None
+            ]
+            if uncached:
+                try:
+                    self._prefetched_summaries = await self._run_batch_job(uncached)
+                except KimiAPIError as e:
+                    logger.warning("Kimi批处理任务失败，回退为普通请求: %s", e)
+
+        # 按批次分组，每批一次Kimi请求，批次间并发
+        batches = [candidates[i:i + self.cfg.batch_size] for i in range(0, len(candidates), self.cfg.batch_size)]
+        tasks = [
+            asyncio.create_task(self._process_batch(batch, i * self.cfg.batch_size, len(candidates), failed_papers))
+            for i, batch in enumerate(batches)
+        ]
+
+        # 任一批次失败即取消尚未完成的批次，与逐篇处理时遇错即停一致，不再为剩余论文调用API
+        pending = set()
+        if tasks:
+            _, pending = await asyncio.wait(tasks, return_when=asyncio.FIRST_EXCEPTION)
+            for task in pending:
+                task.cancel()
+            await asyncio.gather(*pending, return_exceptions=True)
+
+        finished = [task for task in tasks if task not in pending]
+        processed_papers = [record for task in finished if task.exception() is None for record in task.result()]
+        errors = [task.exception() for task in finished if task.exception() is not None]
 
-                # 抛出异常，让调用者决定如何处理
-                raise PaperProcessingError(paper_title, paper_id, e)
+        # 记录处理统计信息
+        total_found = len(papers)
+        total_processed = len(processed_papers)
+        total_filtered = len(filtered_papers)
+        total_failed = len(failed_papers)
+
+        logger.info("📊 论文处理统计:")
+        logger.info("  - 总找到论文: %s 篇", total_found)
+        logger.info("  - 成功处理: %s 篇", total_processed)
+        if excluded_count:
+            logger.info("  - 分类排除: %s 篇", excluded_count)
+        logger.info("  - 相关性过滤: %s 篇", total_filtered)
+        logger.info("  - 处理失败: %s 篇", total_failed)
+        if pending:
+            logger.warning("  - 因处理失败而取消: %s 批", len(pending))
+
+        if filtered_papers:
+            logger.info("🔍 被过滤的低相关性论文 (相关性 < %s):", self.cfg.min_relevance_score)
+            for filtered in filtered_papers:
+                logger.info("  - %s (ID: %s) - 相关性: %.3f", filtered['paper_title'], filtered['paper_id'], filtered['relevance_score'])
+
+        if failed_papers:
+            logger.warning("❌ 处理失败的论文:")
+            for failed in failed_papers:
+                logger.warning("  - %s (ID: %s) - %s", failed['paper_title'], failed['paper_id'], failed['error_message'])
+
+        # 抛出第一个异常，让调用者决定如何处理
+        if errors:
+            raise errors[0]
+
+        return processed_papers
+
+    async def _process_batch(self, batch: List[tuple], start: int, total: int,
+                             failed_papers: List[Dict[str, Any]]) -> List[PaperRecord]:
+        """
+        处理一批论文，并发批次数由信号量限制
+
+        Args:
+            batch: (论文, 相关性分数) 列表
+            start: 批次内第一篇论文的序号（用于日志）
+            total: 待处理论文总数（用于日志）
+            failed_papers: 收集处理失败论文的列表
+
+        Returns:
+            标准化的论文记录列表
+
+        Raises:
+            PaperProcessingError: 当论文处理失败时抛出
+        """
+        async with self._semaphore:
+            for i, (paper, _) in enumerate(batch):
+                logger.info("处理论文 %s/%s: %s (ID: %s)", start+i+1, total, paper.title.strip(), paper.entry_id.split('/')[-1])
+
+            try:
+                # 使用Kimi通过URL分析论文内容
+                summaries = await self.summarize_batch([paper for paper, _ in batch])
 
             except Exception as e:
-                # 记录其他类型的错误
-                logger.error(f"❌ 论文处理失败: {paper_title} (ID: {paper_id}), 错误: {str(e)}")
+                # 定位失败的论文，记录详细信息
+                failed_id = getattr(e, 'paper_id', None)
+                paper, relevance_score = next(
+                    ((p, score) for p, score in batch if p.entry_id.split('/')[-1] == failed_id),
+                    batch[0]
+                )
+                paper_id = paper.entry_id.split('/')[-1]
+                paper_title = paper.title.strip()
+
+                if isinstance(e, KimiAPIError):
+                    logger.error("❌ Kimi API调用失败: %s", e)
+                else:
+                    logger.error("❌ 论文处理失败: %s (ID: %s), 错误: %s", paper_title, paper_id, e)
                 failed_papers.append({
                     "paper_id": paper_id,
                     "paper_title": paper_title,
@@ -498,37 +1240,71 @@ Core problem solved, main method proposed and key contribution in one sentence:
                     "relevance_score": relevance_score
                 })
 
-                # 抛出异常
+                # 抛出异常，让调用者决定如何处理
                 raise PaperProcessingError(paper_title, paper_id, e)
 
-            # 在处理下一篇论文前添加额外延迟
-            if i < len(papers) - 1:  # 不是最后一篇论文
-                logger.debug(f"处理完成，等待{self.paper_processing_delay}秒后处理下一篇论文...")
-                time.sleep(self.paper_processing_delay)
+            processed_papers = []
+            for (paper, relevance_score), summary in zip(batch, summaries):
+                paper_id = paper.entry_id.split('/')[-1]
+                paper_title = paper.title.strip()
+
+                # 构建标准化记录
+                record = PaperRecord(
+                    id=paper_id,
+                    title=paper_title,
+                    authors=list(map(attrgetter('name'), paper.authors)),
+                    published_date=paper.published.strftime("%Y-%m-%d"),
+                    updated_date=paper.updated.strftime("%Y-%m-%d") if paper.updated else None,
+                    categories=paper.categories,
+                    primary_category=paper.primary_category,
+                    pdf_url=paper.pdf_url,
+                    arxiv_url=paper.entry_id,
+                    summary={
+                        "chinese_summary": summary["chinese_summary"],
+                        "english_summary": summary["english_summary"]
+                    },
+                    crawl_timestamp=self._crawl_ts,
+                    relevance_score=relevance_score
+                )
 
-        # 记录处理统计信息
-        total_found = len(papers)
-        total_processed = len(processed_papers)
-        total_filtered = len(filtered_papers)
-        total_failed = len(failed_papers)
+                processed_papers.append(record)
+                logger.info("✅ 成功处理论文: %s (ID: %s), 相关性: %.3f", paper_title, paper_id, relevance_score)
 
-        logger.info(f"📊 论文处理统计:")
-        logger.info(f"  - 总找到论文: {total_found} 篇")
-        logger.info(f"  - 成功处理: {total_processed} 篇")
-        logger.info(f"  - 相关性过滤: {total_filtered} 篇")
-        logger.info(f"  - 处理失败: {total_failed} 篇")
+            # 释放并发名额前添加额外延迟
+            if start + len(batch) < total:  # 不是最后一批论文
+                logger.debug("处理完成，等待%s秒后处理下一批论文...", self.cfg.paper_processing_delay)
+                await asyncio.sleep(self.cfg.paper_processing_delay)
 
-        if filtered_papers:
-            logger.info(f"🔍 被过滤的低相关性论文 (相关性 < {self.min_relevance_score}):")
-            for filtered in filtered_papers:
-                logger.info(f"  - {filtered['paper_title']} (ID: {filtered['paper_id']}) - 相关性: {filtered['relevance_score']:.3f}")
+        return processed_papers
 
-        if failed_papers:
-            logger.warning(f"❌ 处理失败的论文:")
-            for failed in failed_papers:
-                logger.warning(f"  - {failed['paper_title']} (ID: {failed['paper_id']}) - {failed['error_message']}")
+    def _build_keyword_weights(self) -> List[Tuple[str, float]]:
+        """
+        根据搜索主题展开相关性关键词权重表
 
-        return processed_papers
+        Returns:
+            去重后的 (casefold关键词, 权重) 列表，重复关键词保留最高权重
+        """
+        # 未知主题按综合关键词处理
+        keyword_groups = RELEVANCE_KEYWORDS.get(self.cfg.search_topic, RELEVANCE_KEYWORDS['BOTH'])
+
+        weights: Dict[str, float] = {}
+        for keywords, weight in zip(keyword_groups, RELEVANCE_WEIGHTS):
+            for keyword in keywords:
+                weights.setdefault(keyword.casefold(), weight)
+        return list(weights.items())
+
+    def _build_relevance_automaton(self) -> ahocorasick.Automaton:
+        """
+        由关键词权重表构建Aho-Corasick自动机
+
+        Returns:
+            以关键词为模式、(权重, 关键词) 为值的自动机
+        """
+        automaton = ahocorasick.Automaton()
+        for keyword, weight in self._kw_weights:
+            automaton.add_word(keyword, (weight, keyword))
+        automaton.make_automaton()
+        return automaton
 
     def _calculate_relevance_score(self, title: str, abstract: str) -> float:
         """
@@ -541,51 +1317,24 @@ Core problem solved, main method proposed and key contribution in one sentence:
         Returns:
             相关性分数 (0-1)
         """
-        text = (title + " " + abstract).lower()
-        score = 0.0
-
-        # 根据搜索主题定义不同的权重关键词
-        if self.search_topic == 'VLM':
-            # VLM高权重关键词
-            high_weight_keywords = ["vlm", "vision language model", "multimodal", "vision-language"]
-            medium_weight_keywords = ["visual reasoning", "visual instruction", "image captioning", "visual grounding"]
-            low_weight_keywords = ["cross-modal", "image-text", "visual understanding"]
-        elif self.search_topic == 'VLA':
-            # VLA高权重关键词
-            high_weight_keywords = ["vla", "vision language action", "embodied ai", "embodied agent"]
-            medium_weight_keywords = ["robotic manipulation", "action planning", "visual navigation", "robot learning"]
-            low_weight_keywords = ["policy learning", "motor control", "behavioral cloning"]
-        else:  # BOTH
-            # 综合关键词
-            high_weight_keywords = ["vlm", "vla", "vision language model", "vision language action", "embodied ai"]
-            medium_weight_keywords = ["multimodal", "vision-language", "visual reasoning", "robotic manipulation"]
-            low_weight_keywords = ["visual instruction", "image captioning", "action planning", "cross-modal"]
-
-        # 计算分数
-        for keyword in high_weight_keywords:
-            if keyword in text:
-                score += 0.3
-
-        for keyword in medium_weight_keywords:
-            if keyword in text:
-                score += 0.2
-
-        for keyword in low_weight_keywords:
-            if keyword in text:
-                score += 0.1
+        text = f"{title.casefold()} {abstract.casefold()}"
+
+        # 每个关键词只计分一次
+        matched = {keyword: weight for _, (weight, keyword) in self._relevance_automaton.iter(text)}
+        score = sum(matched.values())
 
         return min(score, 1.0)
 
-    def save_to_json(self, papers: List[Dict[str, Any]], filename: str = None) -> str:
+    async def save_to_json(self, papers: List[PaperRecord], filename: str = None) -> str:
         """
-        保存论文数据到JSON文件
+        异步保存论文数据到JSON文件，写盘期间不阻塞事件循环
 
         Args:
-            papers: 处理后的论文数据列表
+            papers: 处理后的论文记录列表
             filename: 输出文件名，默认使用日期
 
         Returns:
-            保存的文件路径
+            保存的文件路径，同目录下另有 <文件路径>.meta 记录论文总数
         """
         if filename is None:
             today = datetime.now().strftime("%Y-%m-%d")
@@ -597,22 +1346,34 @@ Core problem solved, main method proposed and key contribution in one sentence:
         os.makedirs(output_dir, exist_ok=True)
         filepath = os.path.join(output_dir, filename)
 
-        # 构建最终的JSON结构
-        output_data = {
-            "metadata": {
-                "crawl_date": datetime.now().isoformat(),
-                "total_papers": len(papers),
-                "search_keywords": self.keywords,
-                "search_topic": self.search_topic,
-                "min_relevance_score": self.min_relevance_score,
-                "data_source": "arxiv.org"
-            },
-            "papers": papers
+        # 构建元数据
+        metadata = {
+            "crawl_date": datetime.now().isoformat(),
+            "total_papers": len(papers),
+            "search_keywords": self.cfg.search_keywords,
+            "search_topic": self.cfg.search_topic,
+            "min_relevance_score": self.cfg.min_relevance_score,
+            "data_source": "arxiv.org"
         }
+        dump_option = orjson.OPT_INDENT_2 | orjson.OPT_NON_STR_KEYS
 
         try:
-            with open(filepath, 'w', encoding='utf-8') as f:
-                json.dump(output_data, f, ensure_ascii=False, indent=2)
+            # 在内存中拼出 {"metadata": ..., "papers": [...]}，orjson原生支持dataclass；
+            # 整个文档只await一次写入，避免每篇论文一次线程切换
+            papers_json = b',\n'.join(orjson.dumps(paper, option=dump_option) for paper in papers)
+            data = b''.join([
+                b'{\n"metadata": ',
+                orjson.dumps(metadata, option=dump_option),
+                b',\n"papers": [\n' if papers else b',\n"papers": [',
+                papers_json,
+                b'\n]\n}\n',
+            ])
+            async with aiofiles.open(filepath, 'wb') as f:
+                await f.write(data)
+
+            # 附带只含统计信息的小文件，调用者无需解析完整结果即可获取论文数
+            async with aiofiles.open(f"{filepath}.meta", 'wb') as f:
+                await f.write(orjson.dumps({"total_papers": len(papers)}))
 
             logger.info(f"成功保存 {len(papers)} 篇论文到 {filepath}")
             return filepath
@@ -623,7 +1384,20 @@ Core problem solved, main method proposed and key contribution in one sentence:
 
     def run_daily_crawl(self, days_back: int = 1) -> str:
         """
-        执行每日爬取任务
+        同步执行每日爬取任务，在内部创建HTTP会话并运行异步流程
+
+        Args:
+            days_back: 爬取过去几天的论文
+
+        Returns:
+            输出文件路径
+        """
+        date_to = datetime.now(timezone.utc)
+        return self.run_window_crawl(date_to - timedelta(days=days_back), date_to)
+
+    async def run_daily_crawl_async(self, days_back: int = 1) -> str:
+        """
+        异步执行每日爬取任务，需在 async with 爬虫实例的上下文中调用
 
         Args:
             days_back: 爬取过去几天的论文
@@ -631,26 +1405,63 @@ Core problem solved, main method proposed and key contribution in one sentence:
         Returns:
             输出文件路径
         """
-        logger.info("开始执行每日论文爬取任务...")
+        date_to = datetime.now(timezone.utc)
+        return await self.run_window_crawl_async(date_to - timedelta(days=days_back), date_to)
+
+    def run_window_crawl(self, date_from: datetime, date_to: datetime) -> str:
+        """
+        同步执行指定时间窗口的爬取任务，在内部创建HTTP会话并运行异步流程
+
+        Args:
+            date_from: 提交时间窗口起点，不带时区时视为UTC
+            date_to: 提交时间窗口终点，不带时区时视为UTC
+
+        Returns:
+            输出文件路径
+        """
+        async def crawl() -> str:
+            async with self:
+                return await self.run_window_crawl_async(date_from, date_to)
+
+        return asyncio.run(crawl())
+
+    async def run_window_crawl_async(self, date_from: datetime, date_to: datetime) -> str:
+        """
+        异步执行指定时间窗口的爬取任务，需在 async with 爬虫实例的上下文中调用
+
+        整个时间窗口只发起一个arxiv查询。
+
+        Args:
+            date_from: 提交时间窗口起点，不带时区时视为UTC
+            date_to: 提交时间窗口终点，不带时区时视为UTC
+
+        Returns:
+            输出文件路径
+        """
+        logger.info("开始执行论文爬取任务...")
 
         try:
             # 搜索论文
-            papers = self.search_papers(days_back)
+            papers = await asyncio.to_thread(self.search_papers, date_from=date_from, date_to=date_to)
 
             if not papers:
                 logger.warning("未找到相关论文")
                 return None
 
             # 处理论文
-            processed_papers = self.process_papers(papers)
+            processed_papers = await self.process_papers(papers)
 
-            # 按相关性分数排序
-            processed_papers.sort(key=lambda x: x['relevance_score'], reverse=True)
+            # 按相关性分数排序，设置了TOP_K_PAPERS时只保留最相关的K篇
+            by_score = attrgetter('relevance_score')
+            if 0 < self.cfg.top_k_papers < len(processed_papers):
+                processed_papers = heapq.nlargest(self.cfg.top_k_papers, processed_papers, key=by_score)
+            else:
+                processed_papers.sort(key=by_score, reverse=True)
 
             # 保存到JSON文件
-            output_file = self.save_to_json(processed_papers)
+            output_file = await self.save_to_json(processed_papers)
 
-            logger.info(f"每日爬取任务完成，共处理 {len(processed_papers)} 篇论文")
+            logger.info(f"爬取任务完成，共处理 {len(processed_papers)} 篇论文")
             return output_file
 
         except Exception as e:
@@ -667,12 +1478,15 @@ def main():
         logger.error("请设置环境变量 KIMI_API_KEY")
         return
 
-    # 创建爬虫实例
-    crawler = ArxivPaperCrawler(kimi_api_key)
+    async def crawl() -> str:
+        # 创建爬虫实例，会话在退出时关闭
+        async with ArxivPaperCrawler(kimi_api_key) as crawler:
+            date_to = datetime.now(timezone.utc)
+            return await crawler.run_window_crawl_async(date_to - timedelta(days=3), date_to)
 
     try:
         # 执行每日爬取
-        output_file = crawler.run_daily_crawl(days_back=3)
+        output_file = asyncio.run(crawl())
 
         if output_file:
             print(f"✅ 爬取完成！结果已保存到: {output_file}")
@@ -5,7 +5,36 @@
 """
 
 import os
-from typing import List
+from dataclasses import dataclass
+from typing import FrozenSet, List, Optional, Tuple
+
+
+@dataclass(frozen=True, slots=True)
+class RuntimeConfig:
+    """运行时配置快照，由 Config.load() 一次性生成"""
+
+    search_keywords: Tuple[str, ...]
+    search_topic: str
+    max_results: int
+    kimi_request_delay: float
+    paper_processing_delay: float
+    min_relevance_score: float
+    top_k_papers: int
+    exclude_categories: FrozenSet[str]
+    enable_verification: bool
+    max_verification_attempts: int
+    verification_similarity_threshold: float
+    max_workers: int
+    kimi_max_concurrency: int
+    batch_size: int
+    max_retry_attempts: int
+    retry_delay: float
+    kimi_batch_job: bool
+    kimi_batch_job_timeout: int
+    enable_cache: bool
+    cache_dir: str
+    cache_expiry_hours: int
+
 
 class Config:
     """配置类"""
@@ -32,12 +61,10 @@ class Config:
         "visual question answering",
         "image captioning",
         "visual grounding",
-        # "multimodal learning",
         "cross-modal",
         "vision-and-language",
         "visual understanding",
         "image-text",
-        # "visual-linguistic"
     ]
 
     # VLA相关关键词
@@ -46,17 +73,11 @@ class Config:
         "VLA",
         "embodied AI",
         "embodied agent",
-        # "robotic manipulation",
-        # "action planning",
-        # "visual navigation",
-        # "robot learning",
         "embodied intelligence",
         "action prediction",
         "behavioral cloning",
         "imitation learning",
-        # "reinforcement learning",
         "policy learning",
-        # "motor control"
     ]
 
     # 动态生成搜索关键词
@@ -73,6 +94,37 @@ class Config:
             # 默认返回VLM关键词
             return cls.VLM_KEYWORDS
 
+    _runtime: Optional[RuntimeConfig] = None
+
+    @classmethod
+    def load(cls) -> RuntimeConfig:
+        """返回运行时配置快照，首次调用时生成并缓存"""
+        if cls._runtime is None:
+            cls._runtime = RuntimeConfig(
+                search_keywords=tuple(cls.get_search_keywords()),
+                search_topic=cls.SEARCH_TOPIC,
+                max_results=cls.MAX_RESULTS,
+                kimi_request_delay=cls.KIMI_REQUEST_DELAY,
+                paper_processing_delay=cls.PAPER_PROCESSING_DELAY,
+                min_relevance_score=cls.MIN_RELEVANCE_SCORE,
+                top_k_papers=cls.TOP_K_PAPERS,
+                exclude_categories=frozenset(c.strip() for c in cls.EXCLUDE_CATEGORIES if c.strip()),
+                enable_verification=cls.ENABLE_VERIFICATION,
+                max_verification_attempts=cls.MAX_VERIFICATION_ATTEMPTS,
+                verification_similarity_threshold=cls.VERIFICATION_SIMILARITY_THRESHOLD,
+                max_workers=cls.MAX_WORKERS,
+                kimi_max_concurrency=cls.KIMI_MAX_CONCURRENCY,
+                batch_size=max(1, cls.BATCH_SIZE),
+                max_retry_attempts=max(1, cls.MAX_RETRY_ATTEMPTS),
+                retry_delay=cls.RETRY_DELAY,
+                kimi_batch_job=cls.KIMI_BATCH_JOB,
+                kimi_batch_job_timeout=cls.KIMI_BATCH_JOB_TIMEOUT,
+                enable_cache=cls.ENABLE_CACHE,
+                cache_dir=cls.CACHE_DIR,
+                cache_expiry_hours=cls.CACHE_EXPIRY_HOURS,
+            )
+        return cls._runtime
+
     # 兼容性：保持原有的SEARCH_KEYWORDS属性
     @property
     def SEARCH_KEYWORDS(self) -> List[str]:
@@ -87,7 +139,7 @@ class Config:
     # API请求配置
     REQUEST_TIMEOUT = int(os.getenv('REQUEST_TIMEOUT', '30'))
     REQUEST_DELAY = float(os.getenv('REQUEST_DELAY', '2.0'))  # 请求间隔秒数
-    KIMI_REQUEST_DELAY = float(os.getenv('KIMI_REQUEST_DELAY', '30.0'))  # Kimi API请求前等待时间
+    KIMI_REQUEST_DELAY = float(os.getenv('KIMI_REQUEST_DELAY', '30.0'))  # Kimi API相邻请求的最小间隔
     PAPER_PROCESSING_DELAY = float(os.getenv('PAPER_PROCESSING_DELAY', '5.0'))  # 论文处理间隔时间
 
     # 新增：错误处理配置
@@ -101,8 +153,8 @@ class Config:
 
     # 新增：验证配置
     ENABLE_VERIFICATION = os.getenv('ENABLE_VERIFICATION', 'true').lower() == 'true'  # 是否启用验证
-    VERIFICATION_DELAY = float(os.getenv('VERIFICATION_DELAY', '30.0'))  # 验证前等待时间
     MAX_VERIFICATION_ATTEMPTS = int(os.getenv('MAX_VERIFICATION_ATTEMPTS', '2'))  # 最大验证重试次数
+    VERIFICATION_SIMILARITY_THRESHOLD = float(os.getenv('VERIFICATION_SIMILARITY_THRESHOLD', '0.2'))  # 总结与摘要的实词词频相似度（去除停用词）低于该值时才调用API验证
 
     # 新增：PDF处理配置
     PDF_TIMEOUT = int(os.getenv('PDF_TIMEOUT', '60'))  # PDF分析超时时间
@@ -115,11 +167,16 @@ class Config:
 
     # 新增：论文过滤配置
     MIN_RELEVANCE_SCORE = float(os.getenv('MIN_RELEVANCE_SCORE', '0.2'))  # 最小相关性分数
+    TOP_K_PAPERS = int(os.getenv('TOP_K_PAPERS', '0'))  # 输出中只保留相关性最高的K篇，0表示全部保留
     EXCLUDE_CATEGORIES = os.getenv('EXCLUDE_CATEGORIES', '').split(',') if os.getenv('EXCLUDE_CATEGORIES') else []  # 排除的分类
 
     # 新增：并发和性能配置
     ENABLE_PARALLEL_PROCESSING = os.getenv('ENABLE_PARALLEL_PROCESSING', 'false').lower() == 'true'  # 是否启用并行处理
     MAX_WORKERS = int(os.getenv('MAX_WORKERS', '3'))  # 最大并发工作线程数
+    KIMI_MAX_CONCURRENCY = int(os.getenv('KIMI_MAX_CONCURRENCY', '10'))  # 同时在途的Kimi请求数上限，同时决定连接池大小
+    BATCH_SIZE = int(os.getenv('BATCH_SIZE', '5'))  # 每次Kimi请求批量总结的论文数，1表示逐篇总结
+    KIMI_BATCH_JOB = os.getenv('KIMI_BATCH_JOB', 'false').lower() == 'true'  # 是否通过Kimi批处理任务接口一次提交全部论文
+    KIMI_BATCH_JOB_TIMEOUT = int(os.getenv('KIMI_BATCH_JOB_TIMEOUT', '3600'))  # 等待批处理任务完成的最长秒数，超时回退为普通请求
 
     # 新增：通知配置
     ENABLE_EMAIL_NOTIFICATION = os.getenv('ENABLE_EMAIL_NOTIFICATION', 'false').lower() == 'true'  # 是否启用邮件通知
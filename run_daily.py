@@ -7,18 +7,39 @@
 
 import sys
 import os
-from datetime import datetime
+import json
+import asyncio
+from datetime import datetime, timedelta, timezone
 from arxiv_paper_crawler import ArxivPaperCrawler
 from config import Config
 from setup_logging import get_logger
 
+async def run_crawl() -> str:
+    """创建爬虫实例并执行爬取，结束时关闭HTTP会话"""
+    async with ArxivPaperCrawler(
+        kimi_api_key=Config.KIMI_API_KEY,
+        kimi_base_url=Config.KIMI_BASE_URL
+    ) as crawler:
+        # 启动时清理过期缓存，避免缓存目录随每日运行无限增长
+        crawler.purge_stale_cache()
+        # 整个回溯窗口合并为一个arxiv查询
+        date_to = datetime.now(timezone.utc)
+        return await crawler.run_window_crawl_async(date_to - timedelta(days=Config.DAYS_BACK), date_to)
+
 def main():
     """主函数"""
     logger = get_logger('daily_crawl')
 
-    logger.info("=" * 50)
-    logger.info(f"开始每日论文爬取任务 - {datetime.now().strftime('%Y-%m-%d %H:%M:%S')}")
-    logger.info("=" * 50)
+    # arxiv库内部使用requests，安装全局HTTP缓存后，同一天重复运行时相同的查询页直接从SQLite返回
+    if Config.ENABLE_CACHE:
+        import requests_cache
+        requests_cache.install_cache(
+            os.path.join(Config.CACHE_DIR, 'arxiv'),
+            backend='sqlite',
+            expire_after=Config.CACHE_EXPIRY_HOURS * 3600
+        )
+
+    logger.info("\n%s\n%s\n%s", "=" * 50, f"开始每日论文爬取任务 - {datetime.now().strftime('%Y-%m-%d %H:%M:%S')}", "=" * 50)
 
     # 检查API密钥
     if not Config.KIMI_API_KEY:
@@ -27,24 +48,16 @@ def main():
         sys.exit(1)
 
     try:
-        # 创建爬虫实例
-        crawler = ArxivPaperCrawler(
-            kimi_api_key=Config.KIMI_API_KEY,
-            kimi_base_url=Config.KIMI_BASE_URL
-        )
-
         # 执行爬取
-        output_file = crawler.run_daily_crawl(days_back=Config.DAYS_BACK)
+        output_file = asyncio.run(run_crawl())
 
         if output_file:
             logger.info(f"✅ 每日爬取任务完成！")
             logger.info(f"📄 结果文件: {output_file}")
 
-            # 显示统计信息
-            import json
-            with open(output_file, 'r', encoding='utf-8') as f:
-                data = json.load(f)
-                total_papers = data['metadata']['total_papers']
+            # 显示统计信息，只读取统计小文件，不解析完整结果
+            with open(f"{output_file}.meta", 'r', encoding='utf-8') as f:
+                total_papers = json.load(f)['total_papers']
                 logger.info(f"📊 共处理 {total_papers} 篇论文")
         else:
             logger.warning("⚠️  未找到相关论文")
@@ -53,9 +66,7 @@ def main():
         logger.error(f"❌ 任务执行失败: {e}")
         sys.exit(1)
 
-    logger.info("=" * 50)
-    logger.info("每日任务结束")
-    logger.info("=" * 50)
+    logger.info("\n%s\n%s\n%s", "=" * 50, "每日任务结束", "=" * 50)
 
 if __name__ == "__main__":
     main()
\ No newline at end of file
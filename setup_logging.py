@@ -5,10 +5,84 @@
 """
 
 import os
+import sys
+import queue
+import atexit
 import logging
+import logging.handlers
 from datetime import datetime
 from config import Config
 
+# 日志级别只在导入时解析一次，配置错误时立即报错
+_LEVEL = getattr(logging, Config.LOG_LEVEL.upper(), None)
+if not isinstance(_LEVEL, int):
+    raise ValueError(f"无效的日志级别 LOG_LEVEL={Config.LOG_LEVEL!r}")
+
+# 日志目录只需在导入时创建一次
+os.makedirs(Config.LOG_DIR, exist_ok=True)
+
+# 已配置的日志器，get_logger 重复调用时直接返回
+_LOGGER_CACHE: dict[str, logging.Logger] = {}
+
+class BufferedFileHandler(logging.FileHandler):
+    """
+    带64KB写缓冲的文件处理器
+
+    普通记录只写入缓冲区，不逐条flush；ERROR及以上级别的记录立即flush，
+    其余内容在缓冲区写满或处理器关闭时写入磁盘。
+    """
+
+    def _open(self):
+        return open(self.baseFilename, self.mode, buffering=65536,
+                    encoding=self.encoding, errors=self.errors)
+
+    def emit(self, record: logging.LogRecord) -> None:
+        if self.stream is None:
+            self.stream = self._open()
+        try:
+            self.stream.write(self.format(record) + self.terminator)
+            if record.levelno >= logging.ERROR:
+                self.flush()
+        except RecursionError:
+            raise
+        except Exception:
+            self.handleError(record)
+
+class LoggerRouter(logging.Handler):
+    """
+    按日志器名称把队列中的记录分发给对应日志器自己的处理器
+
+    子日志器（如 arxiv_crawler.cache）的记录沿点分名称向上，交给最近的已配置祖先处理。
+    """
+
+    def __init__(self):
+        super().__init__()
+        self.routes: dict[str, list[logging.Handler]] = {}
+
+    def handle(self, record: logging.LogRecord) -> bool:
+        name = record.name
+        while name and name not in self.routes:
+            name = name.rpartition('.')[0]
+        for handler in self.routes.get(name, ()):
+            if record.levelno >= handler.level:
+                handler.handle(record)
+        return True
+
+# 所有日志器共用一个队列和一个后台线程写文件和控制台，不阻塞调用方
+_LOG_QUEUE: queue.Queue = queue.Queue(-1)
+_ROUTER = LoggerRouter()
+_LISTENER = logging.handlers.QueueListener(_LOG_QUEUE, _ROUTER)
+_LISTENER.start()
+
+def _shutdown_logging() -> None:
+    """退出时先排空队列，再关闭处理器，把文件写缓冲中的内容写入磁盘"""
+    _LISTENER.stop()
+    for handlers in _ROUTER.routes.values():
+        for handler in handlers:
+            handler.close()
+
+atexit.register(_shutdown_logging)
+
 def setup_logger(name: str, log_filename: str = None) -> logging.Logger:
     """
     设置统一的日志配置
@@ -20,9 +94,6 @@ def setup_logger(name: str, log_filename: str = None) -> logging.Logger:
     Returns:
         配置好的日志器
     """
-    # 创建日志目录
-    os.makedirs(Config.LOG_DIR, exist_ok=True)
-
     # 如果没有提供文件名，使用默认格式
     if log_filename is None:
         timestamp = datetime.now().strftime("%Y%m%d")
@@ -30,7 +101,7 @@ def setup_logger(name: str, log_filename: str = None) -> logging.Logger:
 
     # 创建日志器
     logger = logging.getLogger(name)
-    logger.setLevel(getattr(logging, Config.LOG_LEVEL))
+    logger.setLevel(_LEVEL)
 
     # 避免重复添加处理器
     if logger.handlers:
@@ -42,21 +113,24 @@ def setup_logger(name: str, log_filename: str = None) -> logging.Logger:
     )
 
     # 文件处理器
-    file_handler = logging.FileHandler(
+    file_handler = BufferedFileHandler(
         os.path.join(Config.LOG_DIR, log_filename),
         encoding='utf-8'
     )
-    file_handler.setLevel(getattr(logging, Config.LOG_LEVEL))
+    file_handler.setLevel(_LEVEL)
     file_handler.setFormatter(formatter)
+    handlers = [file_handler]
 
-    # 控制台处理器
-    console_handler = logging.StreamHandler()
-    console_handler.setLevel(logging.INFO)
-    console_handler.setFormatter(formatter)
+    # 控制台处理器：cron等非终端环境下输出无人查看，除非设置FORCE_CONSOLE_LOG，否则不添加
+    if sys.stderr.isatty() or os.environ.get('FORCE_CONSOLE_LOG'):
+        console_handler = logging.StreamHandler()
+        console_handler.setLevel(logging.INFO)
+        console_handler.setFormatter(formatter)
+        handlers.append(console_handler)
 
-    # 添加处理器
-    logger.addHandler(file_handler)
-    logger.addHandler(console_handler)
+    # 日志器只把记录放入共享队列，由后台线程分发给上述处理器
+    _ROUTER.routes[name] = handlers
+    logger.addHandler(logging.handlers.QueueHandler(_LOG_QUEUE))
 
     return logger
 
@@ -70,4 +144,7 @@ def get_logger(name: str) -> logging.Logger:
     Returns:
         日志器实例
     """
-    return setup_logger(name)
\ No newline at end of file
+    logger = _LOGGER_CACHE.get(name)
+    if logger is None:
+        logger = _LOGGER_CACHE[name] = setup_logger(name)
+    return logger
\ No newline at end of file